@@ -1,7 +1,12 @@
-""" Mifflin-St Jeor TDEE calculator with robust I/O and unit handling """
+"""
+Mifflin-St Jeor TDEE calculator with robust I/O and unit handling.
+The CLI uses only the standard library; bmr_batch additionally needs NumPy.
+"""
 #!/usr/bin/env python3
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
+from enum import IntEnum
 
 # ---------- Conversions ----------
 def lbs_to_kg(lbs: float) -> float:
@@ -17,34 +22,92 @@ def cm_to_inches(cm: float) -> float:
     return cm / 2.54
 
 # ---------- Core formulas ----------
+def _mk_bmr(offset: float):
+    def bmr(weight_kg: float, height_cm: float, age_years: int) -> float:
+        return 10.0 * weight_kg + 6.25 * height_cm - 5.0 * age_years + offset
+    return bmr
+
+# BMR specialized per sex; batch callers can fetch one once and call it per row
+_BMR_BY_SEX = {"m": _mk_bmr(5.0), "f": _mk_bmr(-161.0)}
+
 def bmr_mifflin_st_jeor(sex: str, weight_kg: float, height_cm: float, age_years: int) -> float:
     """
     sex: 'm' or 'f'
     Returns Basal Metabolic Rate (kcal/day).
     """
-    s = sex.lower()
-    if s not in ("m", "f"):
+    fn = _BMR_BY_SEX.get(sex.lower())
+    if fn is None:
         raise ValueError("sex must be 'm' or 'f'")
-    base = 10 * weight_kg + 6.25 * height_cm - 5 * age_years
-    return base + 5 if s == "m" else base - 161
-
-# Standard ACSM-style multipliers
-ACTIVITY_FACTORS = {
-    "sedentary": 1.2,              # little or no exercise
-    "light": 1.375,                # 1–3 days/wk
-    "moderate": 1.55,              # 3–5 days/wk
-    "very": 1.725,                 # 6–7 days/wk
-    "athlete": 1.9,                # very hard exercise/physical job
+    return fn(weight_kg, height_cm, age_years)
+
+def bmr_tdee(sex: str, weight_kg: float, height_cm: float, age_years: int, factor: float) -> tuple[float, float]:
+    """
+    factor: activity multiplier applied to the BMR.
+    Returns (BMR, TDEE) in kcal/day.
+    """
+    bmr = bmr_mifflin_st_jeor(sex, weight_kg, height_cm, age_years)
+    return bmr, bmr * factor
+
+def bmr_batch(sex, weight_kg, height_cm, age):
+    """
+    Vectorized Mifflin-St Jeor BMR for many people at once.
+    sex: array of 0/1 (1 = male); weight_kg, height_cm, age: arrays of equal length.
+    Returns a float64 array of BMR values (kcal/day).
+    Requires NumPy, an optional dependency; the CLI itself does not need it.
+    """
+    import numpy as np
+
+    sex = np.asarray(sex)
+    if not ((sex == 0) | (sex == 1)).all():
+        raise ValueError("sex must be 0 (female) or 1 (male)")
+    weight_kg = np.asarray(weight_kg, dtype=np.float64)
+    height_cm = np.asarray(height_cm, dtype=np.float64)
+    age = np.asarray(age, dtype=np.float64)
+    offset = np.where(sex == 1, 5.0, -161.0)
+    return 10.0 * weight_kg + 6.25 * height_cm - 5.0 * age + offset
+
+class Activity(IntEnum):
+    SEDENTARY = 0                  # little or no exercise
+    LIGHT = 1                      # 1–3 days/wk
+    MODERATE = 2                   # 3–5 days/wk
+    VERY = 3                       # 6–7 days/wk
+    ATHLETE = 4                    # very hard exercise/physical job
+
+# Standard ACSM-style multipliers, indexed by Activity
+_FACTORS = (1.2, 1.375, 1.55, 1.725, 1.9)
+
+# User-facing names; only consulted once per input at the CLI boundary
+_STR2ACT = {
+    "sedentary": Activity.SEDENTARY,
+    "light": Activity.LIGHT,
+    "moderate": Activity.MODERATE,
+    "very": Activity.VERY,
+    "athlete": Activity.ATHLETE,
 }
+_ACTIVITY_ERROR = f"activity must be one of: {', '.join(_STR2ACT)}"
 
-def tdee_from_bmr(bmr: float, activity_key: str) -> float:
-    key = activity_key.lower()
-    if key not in ACTIVITY_FACTORS:
-        raise ValueError(f"activity must be one of: {', '.join(ACTIVITY_FACTORS)}")
-    return bmr * ACTIVITY_FACTORS[key]
+def activity_factor(activity) -> float:
+    """
+    activity: an Activity (or its int value), or one of its names as a string.
+    Returns the activity multiplier.
+    """
+    if isinstance(activity, str):
+        activity = _STR2ACT.get(activity.lower())
+        if activity is None:
+            raise ValueError(_ACTIVITY_ERROR)
+    elif not (isinstance(activity, int) and 0 <= activity < len(_FACTORS)):
+        raise ValueError(_ACTIVITY_ERROR)
+    return _FACTORS[activity]
+
+def tdee_from_bmr(bmr: float, activity) -> float:
+    """
+    activity: as accepted by activity_factor.
+    Returns Total Daily Energy Expenditure (kcal/day).
+    """
+    return bmr * activity_factor(activity)
 
 # ---------- Data model (optional but clean) ----------
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Person:
     sex: str          # 'm' or 'f'
     age: int          # years
@@ -52,28 +115,64 @@ class Person:
     weight_unit: str  # 'kg' or 'lb'
     height: float     # numeric
     height_unit: str  # 'cm' or 'in'
-    activity: str     # one of ACTIVITY_FACTORS keys
+    activity: Activity
+    _w_kg: float = field(init=False, repr=False, compare=False)
+    _h_cm: float = field(init=False, repr=False, compare=False)
+    _w_lb: float = field(init=False, repr=False, compare=False)
+    _h_in: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Convert units once, keeping the number as entered
+        w_unit = self.weight_unit.lower()
+        if w_unit not in ("kg", "lb"):
+            raise ValueError("weight unit must be 'kg' or 'lb'")
+        h_unit = self.height_unit.lower()
+        if h_unit not in ("cm", "in"):
+            raise ValueError("height unit must be 'cm' or 'in'")
+        if w_unit == "lb":
+            w_kg, w_lb = lbs_to_kg(self.weight), self.weight
+        else:
+            w_kg, w_lb = self.weight, kg_to_lbs(self.weight)
+        if h_unit == "in":
+            h_cm, h_in = inches_to_cm(self.height), self.height
+        else:
+            h_cm, h_in = self.height, cm_to_inches(self.height)
+        object.__setattr__(self, "_w_kg", w_kg)
+        object.__setattr__(self, "_h_cm", h_cm)
+        object.__setattr__(self, "_w_lb", w_lb)
+        object.__setattr__(self, "_h_in", h_in)
 
     def weight_kg(self) -> float:
-        return self.weight if self.weight_unit.lower() == "kg" else lbs_to_kg(self.weight)
+        return self._w_kg
 
     def height_cm(self) -> float:
-        return self.height if self.height_unit.lower() == "cm" else inches_to_cm(self.height)
+        return self._h_cm
+
+    def weight_lb(self) -> float:
+        return self._w_lb
+
+    def height_in(self) -> float:
+        return self._h_in
 
 # ---------- CLI helpers ----------
+# Validate input up front so bad entries never go through exception handling
+_FLOAT_RE = re.compile(r"[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?")
+# Bounded so int() never hits the interpreter's digit limit; ages need far fewer
+_INT_RE = re.compile(r"[+-]?\d{1,9}")
+
 def ask_float(prompt: str) -> float:
     while True:
-        try:
-            return float(input(prompt).strip())
-        except ValueError:
-            print("Please enter a number.")
+        s = input(prompt).strip()
+        if _FLOAT_RE.fullmatch(s):
+            return float(s)
+        print("Please enter a number.")
 
 def ask_int(prompt: str) -> int:
     while True:
-        try:
-            return int(input(prompt).strip())
-        except ValueError:
-            print("Please enter an integer.")
+        s = input(prompt).strip()
+        if _INT_RE.fullmatch(s):
+            return int(s)
+        print("Please enter an integer.")
 
 def ask_choice(prompt: str, choices):
     choices_lower = [c.lower() for c in choices]
@@ -103,8 +202,8 @@ def main():
     print("  moderate  = 3–5 days/wk")
     print("  very      = 6–7 days/wk")
     print("  athlete   = very hard exercise/physical job")
-    activity = ask_choice("Choose activity (sedentary/light/moderate/very/athlete): ",
-                          list(ACTIVITY_FACTORS.keys()))
+    activity = _STR2ACT[ask_choice("Choose activity (sedentary/light/moderate/very/athlete): ",
+                                   list(_STR2ACT))]
 
     person = Person(
         sex=sex, age=age,
@@ -116,17 +215,17 @@ def main():
     # Compute
     w_kg = person.weight_kg()
     h_cm = person.height_cm()
-    bmr = bmr_mifflin_st_jeor(person.sex, w_kg, h_cm, person.age)
-    tdee = tdee_from_bmr(bmr, person.activity)
+    factor = activity_factor(person.activity)
+    bmr, tdee = bmr_tdee(person.sex, w_kg, h_cm, person.age, factor)
 
     # Report in both unit systems for convenience
     print("\n--- Results ---")
     print(f"BMR (kcal/day): {bmr:.0f}")
     print(f"TDEE (kcal/day): {tdee:.0f}")
     print("\nFor reference:")
-    print(f"  Weight: {w_kg:.1f} kg  ({kg_to_lbs(w_kg):.1f} lb)")
-    print(f"  Height: {h_cm:.1f} cm  ({cm_to_inches(h_cm):.1f} in)")
-    print(f"  Activity factor used: {ACTIVITY_FACTORS[activity]:.3f}")
+    print(f"  Weight: {w_kg:.1f} kg  ({person.weight_lb():.1f} lb)")
+    print(f"  Height: {h_cm:.1f} cm  ({person.height_in():.1f} in)")
+    print(f"  Activity factor used: {factor:.3f}")
 
 if __name__ == "__main__":
     main()
@@ -3,7 +3,7 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 # ---------- Conversions ----------
 def lbs_to_kg(lbs: float) -> float:
@@ -19,12 +19,27 @@ def cm_to_inches(cm: float) -> float:
     return cm / 2.54
 
 # ---------- Core formulas ----------
+def _mk_bmr(offset: float):
+    def bmr(weight_kg: float, height_cm: float, age_years: int) -> float:
+        return 10.0 * weight_kg + 6.25 * height_cm - 5.0 * age_years + offset
+    return bmr
+
+# BMR formula specialized per sex, so the sex branch is resolved by one lookup
+_BMR_BY_SEX = {"m": _mk_bmr(5.0), "f": _mk_bmr(-161.0)}
+
 def bmr_mifflin_st_jeor(sex: str, weight_kg: float, height_cm: float, age_years: int) -> float:
-    s = sex.lower()
-    if s not in ("m", "f"):
+    fn = _BMR_BY_SEX.get(sex.lower())
+    if fn is None:
         raise ValueError("sex must be 'm' or 'f'")
-    base = 10 * weight_kg + 6.25 * height_cm - 5 * age_years
-    return base + 5 if s == "m" else base - 161
+    return fn(weight_kg, height_cm, age_years)
+
+def bmr_tdee(sex: str, weight_kg: float, height_cm: float, age_years: int, factor: float) -> tuple[float, float]:
+    """
+    factor: activity multiplier applied to the BMR.
+    Returns (BMR, TDEE) in kcal/day.
+    """
+    bmr = bmr_mifflin_st_jeor(sex, weight_kg, height_cm, age_years)
+    return bmr, bmr * factor
 
 ACTIVITY_FACTORS = {
     "Sedentary (little/no exercise)": 1.2,
@@ -33,9 +48,11 @@ ACTIVITY_FACTORS = {
     "Very (6–7 days/wk)": 1.725,
     "Athlete (very hard/physical job)": 1.9,
 }
+_ACTIVITY_LABELS = tuple(ACTIVITY_FACTORS)
+_DEFAULT_ACTIVITY = _ACTIVITY_LABELS[1]
 
 # ---------- Model ----------
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Person:
     sex: str          # 'm' or 'f'
     age: int          # years
@@ -44,12 +61,43 @@ class Person:
     height: float     # numeric
     height_unit: str  # 'cm' or 'in'
     activity_label: str  # key from ACTIVITY_FACTORS
+    _w_kg: float = field(init=False, repr=False, compare=False)
+    _h_cm: float = field(init=False, repr=False, compare=False)
+    _w_lb: float = field(init=False, repr=False, compare=False)
+    _h_in: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Resolve units up front; the Reference line reads both systems
+        w_unit = self.weight_unit.lower()
+        if w_unit not in ("kg", "lb"):
+            raise ValueError("weight unit must be 'kg' or 'lb'")
+        h_unit = self.height_unit.lower()
+        if h_unit not in ("cm", "in"):
+            raise ValueError("height unit must be 'cm' or 'in'")
+        if w_unit == "lb":
+            w_kg, w_lb = lbs_to_kg(self.weight), self.weight
+        else:
+            w_kg, w_lb = self.weight, kg_to_lbs(self.weight)
+        if h_unit == "in":
+            h_cm, h_in = inches_to_cm(self.height), self.height
+        else:
+            h_cm, h_in = self.height, cm_to_inches(self.height)
+        object.__setattr__(self, "_w_kg", w_kg)
+        object.__setattr__(self, "_h_cm", h_cm)
+        object.__setattr__(self, "_w_lb", w_lb)
+        object.__setattr__(self, "_h_in", h_in)
 
     def weight_kg(self) -> float:
-        return self.weight if self.weight_unit == "kg" else lbs_to_kg(self.weight)
+        return self._w_kg
 
     def height_cm(self) -> float:
-        return self.height if self.height_unit == "cm" else inches_to_cm(self.height)
+        return self._h_cm
+
+    def weight_lb(self) -> float:
+        return self._w_lb
+
+    def height_in(self) -> float:
+        return self._h_in
 
 # ---------- GUI ----------
 class TDEEApp(tk.Tk):
@@ -95,8 +143,8 @@ class TDEEApp(tk.Tk):
         # Row 3: Activity
         row += 1
         ttk.Label(main, text="Activity level:").grid(row=row, column=0, sticky="w", padx=(0,8), pady=6)
-        self.activity_var = tk.StringVar(value=list(ACTIVITY_FACTORS.keys())[1])
-        ttk.Combobox(main, textvariable=self.activity_var, values=list(ACTIVITY_FACTORS.keys()), state="readonly", width=30)\
+        self.activity_var = tk.StringVar(value=_DEFAULT_ACTIVITY)
+        ttk.Combobox(main, textvariable=self.activity_var, values=_ACTIVITY_LABELS, state="readonly", width=30)\
             .grid(row=row, column=1, columnspan=3, sticky="w")
 
         # Row 4: Buttons
@@ -128,7 +176,7 @@ class TDEEApp(tk.Tk):
         self.sex_var.set("m")
         self.weight_unit_var.set("kg")
         self.height_unit_var.set("cm")
-        self.activity_var.set(list(ACTIVITY_FACTORS.keys())[1])
+        self.activity_var.set(_DEFAULT_ACTIVITY)
         self.bmr_label.config(text="BMR (kcal/day): —")
         self.tdee_label.config(text="TDEE (kcal/day): —")
         self.ref_label.config(text="Reference: —")
@@ -164,16 +212,15 @@ class TDEEApp(tk.Tk):
 
             w_kg = person.weight_kg()
             h_cm = person.height_cm()
-            bmr = bmr_mifflin_st_jeor(person.sex, w_kg, h_cm, person.age)
             factor = ACTIVITY_FACTORS[activity]
-            tdee = bmr * factor
+            bmr, tdee = bmr_tdee(person.sex, w_kg, h_cm, person.age, factor)
 
             # Present results
             self.bmr_label.config(text=f"BMR (kcal/day): {bmr:.0f}")
             self.tdee_label.config(text=f"TDEE (kcal/day): {tdee:.0f}")
             self.ref_label.config(
-                text=(f"Reference: weight {w_kg:.1f} kg ({kg_to_lbs(w_kg):.1f} lb), "
-                      f"height {h_cm:.1f} cm ({cm_to_inches(h_cm):.1f} in), "
+                text=(f"Reference: weight {w_kg:.1f} kg ({person.weight_lb():.1f} lb), "
+                      f"height {h_cm:.1f} cm ({person.height_in():.1f} in), "
                       f"activity factor {factor:.3f}")
             )
 